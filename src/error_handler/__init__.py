@@ -1,12 +1,39 @@
-from dotenv import dotenv_values
+import functools
+import os
+import types
+from typing import Optional
 
-dotenv_values()
+if os.getenv("ERROR_HANDLER_USE_DOTENV"):
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except OSError:
+        pass
 
 from .config import ErrorConfig
 from .handlers import BaseErrorHandler
 
 
-ERROR_HANDLER = BaseErrorHandler(ErrorConfig())
+_error_handler: Optional[BaseErrorHandler] = None
+
+
+def _get_error_handler() -> BaseErrorHandler:
+    """
+    Create the shared error handler on first use. Keeping construction lazy means importing the package does not
+    instantiate the handler (and, transitively, the default strategies) for applications that never raise.
+    """
+    global _error_handler
+    if _error_handler is None:
+        _error_handler = BaseErrorHandler(ErrorConfig())
+    return _error_handler
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve ERROR_HANDLER lazily on first attribute access.
+    if name == "ERROR_HANDLER":
+        return _get_error_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def configure_error_handler(config: ErrorConfig) -> None:
@@ -27,14 +54,25 @@ def configure_error_handler(config: ErrorConfig) -> None:
     Examples:
         >>> configure_error_handler(config)
     """
-    global ERROR_HANDLER
-    ERROR_HANDLER = BaseErrorHandler(config)
+    global _error_handler
+    _error_handler = BaseErrorHandler(config)
+
+
+# Dunders whose interception breaks object construction or introspection.
+# Operator dunders (e.g. __add__) stay wrapped so protocol errors are still
+# routed through the handler.
+_CATCH_SKIP = frozenset({
+    "__init__", "__new__", "__init_subclass__", "__class_getitem__",
+    "__repr__", "__str__", "__hash__",
+    "__getattr__", "__getattribute__", "__setattr__", "__delattr__",
+})
 
 
 # Decorator to wrap all methods in an error handler
 def catch(cls):
     """
-    Decorator to wrap all methods in an error handler.
+    Decorator to wrap all methods in an error handler. Only plain functions are wrapped; classmethods, staticmethods,
+    descriptors, nested classes and the construction/introspection dunders are left untouched.
 
     Args:
         cls: The class to be wrapped.
@@ -48,14 +86,15 @@ def catch(cls):
         >>>     pass
     """
     def error_handler_method(method):
-        def wrapper(*args, **kwargs):
+        @functools.wraps(method)
+        def wrapper(*args, _get_handler=_get_error_handler, **kwargs):
             try:
                 return method(*args, **kwargs)
             except Exception as e:
-                return ERROR_HANDLER.handle_error(e, func=method,*args, **kwargs)
+                return _get_handler().handle_error(e, func=method, *args, **kwargs)
         return wrapper
 
-    for name, method in cls.__dict__.items():
-        if callable(method):
+    for name, method in list(cls.__dict__.items()):
+        if isinstance(method, types.FunctionType) and name not in _CATCH_SKIP:
             setattr(cls, name, error_handler_method(method))
     return cls
\ No newline at end of file
@@ -0,0 +1,8 @@
+import os
+
+if os.getenv("ERROR_HANDLER_TYPECHECK", "0") == "1":
+    from typeguard import typechecked
+else:
+    def typechecked(target):
+        """No-op stand-in so production code skips typeguard's per-call overhead."""
+        return target
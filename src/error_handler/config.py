@@ -2,7 +2,13 @@ import logging
 import os
 from typing import Optional
 
-from typeguard import typechecked
+from ._typecheck import typechecked
+
+
+# Environment-derived defaults, read once at import instead of on every
+# ErrorConfig construction.
+_DEFAULT_LOG_LEVEL: int = int(getattr(logging, os.getenv('DEFAULT_LOG_LEVEL', "INFO")))
+_DEFAULT_RE_RAISE: bool = os.getenv('DEFAULT_TO_RERAISE_EXCEPTIONS', "false").lower() == "true"
 
 
 @typechecked
@@ -12,5 +18,5 @@ class ErrorConfig:
             log_level: Optional[int] = None,
             re_raise: Optional[bool] = None,
     ):
-        self.log_level: int = log_level or int(getattr(logging, os.getenv('DEFAULT_LOG_LEVEL', "INFO")))
-        self.re_raise: bool = re_raise or os.getenv('DEFAULT_TO_RERAISE_EXCEPTIONS', "false").lower() == "true"
+        self.log_level: int = log_level or _DEFAULT_LOG_LEVEL
+        self.re_raise: bool = re_raise or _DEFAULT_RE_RAISE
@@ -0,0 +1,47 @@
+import functools
+import logging
+from typing import Callable, Optional
+
+from .strategies.core import STRATEGY_REGISTRY
+
+
+def error_handler(strategy_name: Optional[str] = None, logger: Optional[logging.Logger] = None):
+    """
+    Decorator that routes exceptions raised by the wrapped callable to a registered error handling strategy. If no
+    strategy is registered under the given name, or the strategy does not recover, the exception is re-raised after
+    being logged.
+
+    Args:
+        strategy_name (Optional[str]): Name of the strategy in STRATEGY_REGISTRY used to handle exceptions.
+        logger (Optional[logging.Logger]): Logger used to record the exception.
+
+    Returns:
+        The decorator wrapping the callable.
+
+    Examples:
+        >>> @error_handler("logging", logger=logger)
+        ... def risky():
+        ...     pass
+    """
+    def decorator(func: Callable) -> Callable:
+        # Bind the registry once at decoration time so the except path resolves
+        # it as a local instead of a module-global lookup per exception.
+        registry = STRATEGY_REGISTRY
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if logger is not None:
+                    logger.error(f"{func.__qualname__} raised {e!r}")
+                strategy = registry.get(strategy_name) if strategy_name else None
+                if strategy is not None and strategy.can_handle(e):
+                    recovered, response = strategy.handle(e, func=func, *args, **kwargs)
+                    if recovered:
+                        return response
+                raise
+
+        return wrapper
+
+    return decorator
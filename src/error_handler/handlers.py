@@ -1,15 +1,21 @@
 import logging
 import os
-from typing import List, Optional, Set, Dict, Type, Any
-from typeguard import typechecked
+from collections import defaultdict
+from operator import attrgetter
+from typing import List, Optional, Set, Dict, Tuple, Type, Union, Any
 
 from . import ErrorConfig
+from ._typecheck import typechecked
 from .exceptions import StrategyAlreadyInUseError, StrategyTypeError, ErrorHandlerException
-from .predicates.core import Predicate, PredicateFactory
+from .predicates.core import Predicate
 from .strategies.core import ErrorHandlingStrategy
 
 StrategiesType = List[ErrorHandlingStrategy]
 
+# Bound once at import: logging.getLogger takes a module lock and walks the
+# logger dict, so repeated _init_logging calls should not pay for it.
+_LOGGER = logging.getLogger("dev.schrammel.error_handler")
+
 
 @typechecked
 class BaseErrorHandler:
@@ -32,6 +38,7 @@ class BaseErrorHandler:
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             cls._instance = super(BaseErrorHandler, cls).__new__(cls)
+            cls._instance._initialized = False
         return cls._instance
 
     def __init__(self, config: ErrorConfig, strategies: Optional[StrategiesType] = None):
@@ -48,11 +55,31 @@ class BaseErrorHandler:
         Examples:
             >>> handler = BaseErrorHandler(ErrorConfig())
         """
+        if getattr(self, "_initialized", False):
+            # The singleton is being reconfigured: swap the config and adjust
+            # the log level, but do not re-register the default strategies.
+            self.config = config
+            self.logger.setLevel(config.log_level)
+            return
+
         self.strategies: Optional[StrategiesType] = strategies
+        self._sorted_strategies: Optional[StrategiesType] = None
+        self._dispatch_cache: Dict[type, Tuple[ErrorHandlingStrategy, ...]] = {}
         self.config: ErrorConfig = config
         self._init_logging()
-        if os.getenv("ERROR_HANDLER_INCLUDE_DEFAULT_STRATEGIES", "true").lower() == "true":
+        # Default strategies are loaded lazily on the first handled error so
+        # importing the package does not pull in every strategy module.
+        self._strategies_loaded = os.getenv("ERROR_HANDLER_INCLUDE_DEFAULT_STRATEGIES", "true").lower() != "true"
+        self._initialized = True
+
+    def _ensure_strategies_loaded(self):
+        """
+        Load the default strategies on first use. No-op once loaded or when default strategies are disabled via the
+        ERROR_HANDLER_INCLUDE_DEFAULT_STRATEGIES environment variable.
+        """
+        if not self._strategies_loaded:
             self._include_default_strategies()
+            self._strategies_loaded = True
 
     def _include_default_strategies(self):
         """
@@ -69,13 +96,43 @@ class BaseErrorHandler:
             self.strategies = []
 
         self.strategies.extend(DEFAULT_ERROR_HANDLING_STRATEGIES)
+        self._invalidate_strategy_caches()
 
     def _init_logging(self):
         """
         Initialize the logger for the error handler.
         """
-        self.logger = logging.getLogger("dev.schrammel.error_handler")
-        self.logger.setLevel(self.config.log_level)
+        self.logger = _LOGGER
+        if self.logger.level != self.config.log_level:
+            self.logger.setLevel(self.config.log_level)
+
+    def _invalidate_strategy_caches(self):
+        """
+        Drop the sorted snapshot and the per-exception-type dispatch cache. Called whenever the strategy list mutates.
+        """
+        self._sorted_strategies = None
+        self._dispatch_cache.clear()
+
+    def _strategies_for(self, error: Exception) -> Tuple[ErrorHandlingStrategy, ...]:
+        """
+        Return the priority-sorted tuple of strategies that can handle the given error, memoized by exception type.
+        The result only depends on the strategy list and type(error), so the cache is valid until the strategy list
+        mutates. Enabled state is deliberately not baked in, as it is a mutable flag checked at dispatch time.
+
+        Args:
+            error (Exception): The error to be handled.
+
+        Returns:
+            Tuple[ErrorHandlingStrategy, ...]: The strategies able to handle the error, sorted by priority.
+        """
+        key = type(error)
+        candidates = self._dispatch_cache.get(key)
+        if candidates is None:
+            if self._sorted_strategies is None:
+                self._sorted_strategies = sorted(self.strategies, key=attrgetter("_priority"))
+            candidates = tuple(s for s in self._sorted_strategies if s.can_handle(error))
+            self._dispatch_cache[key] = candidates
+        return candidates
 
     def handle_error(self, error: Exception, *args, **kwargs):
         """
@@ -92,29 +149,33 @@ class BaseErrorHandler:
         Examples:
             >>> handler.handle_error(error)
         """
+        self._ensure_strategies_loaded()
+
         if not self.strategies:
             self.logger.warning("No strategies available to handle the error")
 
-        errors = [error]
+        candidates = self._strategies_for(error) if self.strategies else ()
+        return self._dispatch(error, candidates, *args, **kwargs)
 
-        print(f"args: {args}")
-        print(f"kwargs: {kwargs}")
+    def _dispatch(self, error: Exception, candidates: Tuple[ErrorHandlingStrategy, ...], *args, **kwargs):
+        """
+        Run the given pre-resolved strategies against the error. Split out of handle_error so batch callers can
+        resolve the candidate strategies once per exception type.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("args=%r kwargs=%r", args, kwargs)
 
-        if self.strategies:
-            self.sort_strategies()
-            for strategy in self.strategies:
-                if strategy.can_handle(error) and strategy.is_enabled():
-                    self.logger.info(f"Attempting to handle error {error} with strategy {strategy}")
-                    print(f"Attempting to handle error {error} with strategy {strategy}")
-                    recovered, response = strategy.handle(error, *args, **kwargs)
-                    if recovered:
-                        self.logger.info(f"Successfully recovered from error {error} using strategy {strategy}")
-                        return response
-                    else:
-                        self.logger.info(f"Failed to recover from error {error} using strategy {strategy}")
-                        errors.append(response)
+        for strategy in candidates:
+            if strategy.is_enabled():
+                self.logger.info("Attempting to handle error %s with strategy %s", error, strategy)
+                recovered, response = strategy.handle(error, *args, **kwargs)
+                if recovered:
+                    self.logger.info("Successfully recovered from error %s using strategy %s", error, strategy)
+                    return response
+                else:
+                    self.logger.info("Failed to recover from error %s using strategy %s", error, strategy)
 
-        self.logger.error(f"Failed to handle error: {error}")
+        self.logger.error("Failed to handle error: %s", error)
 
         reraise = kwargs.get("reraise", self.config.re_raise)
         if reraise:
@@ -122,8 +183,9 @@ class BaseErrorHandler:
 
     def handle_errors(self, errors: List[Exception]):
         """
-        Handle the given list of errors using the error handling strategies. If the error is not handled, it will be
-        re-raised.
+        Handle the given list of errors using the error handling strategies. Errors are grouped by exception type so
+        the applicable strategies are resolved once per type rather than once per error. If an error is not handled,
+        it will be re-raised.
 
         Args:
             errors (List[Exception]): The list of errors to be handled.
@@ -134,8 +196,16 @@ class BaseErrorHandler:
         Examples:
             >>> handler.handle_errors(errors)
         """
+        self._ensure_strategies_loaded()
+
+        groups: Dict[type, List[Exception]] = defaultdict(list)
         for error in errors:
-            self.handle_error(error)
+            groups[type(error)].append(error)
+
+        for grouped in groups.values():
+            candidates = self._strategies_for(grouped[0]) if self.strategies else ()
+            for error in grouped:
+                self._dispatch(error, candidates)
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""
     " Methods for managing error handling strategies
@@ -145,42 +215,54 @@ class BaseErrorHandler:
         Clear the list of strategies
         """
         self.strategies.clear()
+        self._invalidate_strategy_caches()
 
     def remove_strategy(self, strategy: ErrorHandlingStrategy):
         """
         Remove the given strategy from the list of strategies.
         """
         self.strategies.remove(strategy)
+        self._invalidate_strategy_caches()
 
-    def add_strategy(self, strategy: Type[ErrorHandlingStrategy], exists_ok: bool = False):
+    def add_strategy(
+            self,
+            strategy: Union[Type[ErrorHandlingStrategy], ErrorHandlingStrategy],
+            exists_ok: bool = False
+    ):
         """
-        Add the given strategy to the list of strategies.
+        Add the given strategy to the list of strategies. A strategy class is instantiated before being added, so
+        strategies are tracked as singleton instances carrying their own enabled/priority state.
 
         Args:
-            strategy (ErrorHandlingStrategy): The strategy to be added.
+            strategy (Union[Type[ErrorHandlingStrategy], ErrorHandlingStrategy]): The strategy to be added.
             exists_ok (bool): If True, the function will drop the strategy if it already exists.
 
         Raises:
-            StrategyTypeError: If the strategy is not an instance of ErrorHandlingStrategy.
+            StrategyTypeError: If the strategy is not an ErrorHandlingStrategy.
             StrategyAlreadyInUseError: If the strategy is already in the list of strategies.
 
         Examples:
             >>> handler.add_strategy(strategy)
         """
         self.logger.debug(f"User has requested to add strategy {strategy} to the list of strategies")
-        if not issubclass(strategy, ErrorHandlingStrategy):
+        if isinstance(strategy, type):
+            if not issubclass(strategy, ErrorHandlingStrategy):
+                raise StrategyTypeError("Strategy must be an instance of ErrorHandlingStrategy")
+            strategy = strategy()
+        elif not isinstance(strategy, ErrorHandlingStrategy):
             raise StrategyTypeError("Strategy must be an instance of ErrorHandlingStrategy")
 
         if not self.strategies:
             self.strategies = []
 
         self.logger.debug(f"Currently we have the following strategies: {self.strategies}")
-        print(f"Currently we have the following strategies: {self.strategies}")
 
-        if strategy not in self.strategies:
+        if any(type(existing) is type(strategy) for existing in self.strategies):
+            if not exists_ok:
+                raise StrategyAlreadyInUseError("Strategy already exists in list of strategies")
+        else:
             self.strategies.append(strategy)
-        elif not exists_ok:
-            raise StrategyAlreadyInUseError("Strategy already exists in list of strategies")
+            self._invalidate_strategy_caches()
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""
     " Methods for sorting strategies by priority
@@ -192,7 +274,7 @@ class BaseErrorHandler:
         Examples:
             >>> handler.sort_strategies()
         """
-        self.strategies.sort(key=lambda x: x.priority)
+        self.strategies.sort(key=attrgetter("_priority"))
 
     def reverse_strategies(self):
         """
@@ -210,7 +292,7 @@ class BaseErrorHandler:
         Examples:
             >>> handler.sort_strategies_by_name()
         """
-        self.strategies.sort(key=lambda x: x.name)
+        self.strategies.sort(key=attrgetter("name"))
 
     def reverse_strategies_by_name(self):
         """
@@ -219,7 +301,7 @@ class BaseErrorHandler:
         Examples:
             >>> handler.reverse_strategies_by_name()
         """
-        self.strategies.sort(key=lambda x: x.name, reverse=True)
+        self.strategies.sort(key=attrgetter("name"), reverse=True)
 
     def enable_strategy(self, strategy: ErrorHandlingStrategy):
         """
@@ -231,7 +313,8 @@ class BaseErrorHandler:
         Examples:
             >>> handler.enable_strategy(strategy)
         """
-        strategy.enabled = True
+        strategy.enable()
+        self._dispatch_cache.clear()
 
     def disable_strategy(self, strategy: ErrorHandlingStrategy):
         """
@@ -243,7 +326,24 @@ class BaseErrorHandler:
         Examples:
             >>> handler.disable_strategy(strategy)
         """
-        strategy.enabled = False
+        strategy.disable()
+        self._dispatch_cache.clear()
+
+    def set_strategy_priority(self, strategy: ErrorHandlingStrategy, priority: int):
+        """
+        Change the priority of the given strategy. The priority order is baked into the sorted snapshot and the
+        per-type dispatch cache, so priorities must be changed through this method rather than by calling
+        strategy.set_priority directly; see ErrorHandlingStrategy.set_priority.
+
+        Args:
+            strategy (ErrorHandlingStrategy): The strategy to reprioritize.
+            priority (int): The new priority.
+
+        Examples:
+            >>> handler.set_strategy_priority(strategy, 10)
+        """
+        strategy.set_priority(priority)
+        self._invalidate_strategy_caches()
 
     """""""""""""""""""""""""""""""""""""""""""""""""""""""""
     " Methods for filtering strategies
@@ -263,6 +363,37 @@ class BaseErrorHandler:
         """
         return list(filter(predicate, self.strategies))
 
+    def iter_strategies(self, predicate: Predicate):
+        """
+        Lazily iterate over the strategies matching the given predicate. Unlike filter_strategies this does not
+        materialize a list, so callers that only need the first few matches avoid the extra allocation.
+
+        Args:
+            predicate (Predicate): The predicate to be used for filtering.
+
+        Returns:
+            Iterator[ErrorHandlingStrategy]: An iterator over matching strategies.
+
+        Examples:
+            >>> for strategy in handler.iter_strategies(predicate): ...
+        """
+        return filter(predicate, self.strategies)
+
+    def find_strategy(self, predicate: Predicate) -> Optional[ErrorHandlingStrategy]:
+        """
+        Return the first strategy matching the given predicate, or None. Short-circuits as soon as a match is found.
+
+        Args:
+            predicate (Predicate): The predicate to be used for filtering.
+
+        Returns:
+            Optional[ErrorHandlingStrategy]: The first matching strategy, or None if there is no match.
+
+        Examples:
+            >>> strategy = handler.find_strategy(predicate)
+        """
+        return next(filter(predicate, self.strategies), None)
+
     def filter_strategies_by_name(self, name: str) -> List[ErrorHandlingStrategy]:
         """
         Filter the list of strategies by name.
@@ -276,9 +407,7 @@ class BaseErrorHandler:
         Examples:
             >>> handler.filter_strategies_by_name(name)
         """
-        return self.filter_strategies(
-            PredicateFactory.create_predicate(name, lambda x: x.name == name)
-        )
+        return [s for s in self.strategies if s.name == name]
 
     def filter_strategies_by_priority(self, priority: int):
         """
@@ -293,9 +422,7 @@ class BaseErrorHandler:
         Examples:
             >>> handler.filter_strategies_by_priority(priority)
         """
-        return self.filter_strategies(
-            PredicateFactory.create_predicate('priority', lambda x: x.priority == priority)
-        )
+        return [s for s in self.strategies if s.priority() == priority]
 
     def filter_strategies_by_priority_range(self, min_priority: int, max_priority: int):
         """
@@ -311,6 +438,4 @@ class BaseErrorHandler:
         Examples:
             >>> handler.filter_strategies_by_priority_range(min_priority, max_priority)
         """
-        return self.filter_strategies(
-            PredicateFactory.create_predicate('priority', lambda x: min_priority <= x.priority <= max_priority)
-        )
+        return [s for s in self.strategies if min_priority <= s.priority() <= max_priority]
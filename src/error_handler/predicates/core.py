@@ -1,14 +1,24 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Callable
-
-from typeguard import typechecked
+from operator import attrgetter
+from typing import Any, Callable
 
+from .._typecheck import typechecked
 from ..exceptions import PredicateFunctionException, PredicateNameError
 from ..strategies.core import ErrorHandlingStrategy
 
 logger = logging.getLogger(__name__)
 
+# Cache of synthesized predicate classes keyed on (name, id(func)) so repeated
+# create_predicate calls with the same function reuse the class instead of
+# recompiling it (class creation plus typeguard wrapping is expensive).
+_PREDICATE_CLASS_CACHE: dict = {}
+
+# Cache of attribute-equality closures keyed on (attr, value); the common
+# name/priority filters reuse the same callable instead of building a new
+# predicate object per call.
+_EQ_PREDICATE_CACHE: dict = {}
+
 
 @typechecked
 class BasePredicate(ABC):
@@ -42,6 +52,24 @@ class Predicate(BasePredicate):
 
 @typechecked
 class PredicateFactory:
+    @staticmethod
+    def eq(attr: str, value: Any) -> Callable:
+        """
+        Return a cached callable testing strategy.<attr> == value. A plain closure already satisfies filter(), so no
+        Predicate subclass is synthesized; the attrgetter runs at C level and repeated (attr, value) pairs reuse the
+        same callable.
+        """
+        key = (attr, value)
+        predicate = _EQ_PREDICATE_CACHE.get(key)
+        if predicate is None:
+            getter = attrgetter(attr)
+
+            def predicate(strategy: ErrorHandlingStrategy, _value=value, _get=getter) -> bool:
+                return _get(strategy) == _value
+
+            _EQ_PREDICATE_CACHE[key] = predicate
+        return predicate
+
     @staticmethod
     def create_predicate(name: str, func_: Callable) -> Predicate:
         if not isinstance(name, str):
@@ -50,8 +78,14 @@ class PredicateFactory:
         if not callable(func_):
             raise PredicateFunctionException("Function must be callable.")
 
-        class CustomPredicate(Predicate):
-            def predicate(self, strategy: ErrorHandlingStrategy) -> bool:
-                return func_(strategy)
+        key = (name, id(func_))
+        predicate_class = _PREDICATE_CLASS_CACHE.get(key)
+        if predicate_class is None:
+            class CustomPredicate(Predicate):
+                def predicate(self, strategy: ErrorHandlingStrategy) -> bool:
+                    return func_(strategy)
+
+            predicate_class = CustomPredicate
+            _PREDICATE_CLASS_CACHE[key] = predicate_class
 
-        return CustomPredicate(name)
+        return predicate_class(name)
@@ -3,82 +3,98 @@ import os
 from abc import ABC, abstractmethod
 from typing import Callable, Any, Dict, Tuple
 
-from typeguard import typechecked
-
+from src.error_handler._typecheck import typechecked
 from src.error_handler.exceptions import ErrorHandlerException
 
 DEFAULT_ERROR_HANDLING_STRATEGIES = []
 
+# Environment-derived defaults, read once at import instead of on every class
+# load / set_priority call.
+_DEFAULT_PRIORITY: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY", 20))
+_DEFAULT_ENABLED: bool = os.getenv("DEFAULT_ERROR_STRATEGY_ENABLED", "true").lower() == "true"
+_DEFAULT_LOGGER_NAME: str = os.getenv("DEFAULT_LOGGER_NAME", "dev.schrammel.error_handler")
+_MIN_PRIORITY: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY_MINIMUM", 1))
+_MAX_PRIORITY: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY_MAXIMUM", 100))
+
 
 @typechecked
 class ErrorHandlingStrategy(ABC):
     """
     Abstract base class for error handling strategies. Strategies are used to handle exceptions in a specific way.
+
+    Strategies are used as singleton instances: the enabled flag and priority live on the instance (in __slots__)
+    rather than on the class, so toggling one does not write through the type's __dict__ and invalidate CPython's
+    method cache for the whole type.
     """
-    _priority: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY", 20))
-    _enabled: bool = os.getenv("DEFAULT_ERROR_STRATEGY_ENABLED", "true").lower() == "true"
-    _logger: logging.Logger = logging.getLogger(os.getenv("DEFAULT_LOGGER_NAME", "dev.schrammel.error_handler"))
+    __slots__ = ("_enabled", "_priority")
+
+    _logger: logging.Logger = logging.getLogger(_DEFAULT_LOGGER_NAME)
+    name: str = "ErrorHandlingStrategy"
 
-    @classmethod
-    def is_enabled(cls) -> bool:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Expose the name as a plain attribute so sort and filter keys can
+        # read it directly instead of going through a method call.
+        cls.name = cls.__name__
+
+    def __init__(self):
+        self._priority: int = _DEFAULT_PRIORITY
+        self._enabled: bool = _DEFAULT_ENABLED
+
+    def is_enabled(self) -> bool:
         """
         Check if the strategy is enabled.
         """
-        return cls._enabled
+        return self._enabled
 
-    @classmethod
-    def enable(cls) -> None:
+    def enable(self) -> None:
         """
         Enable the strategy.
         """
-        cls._enabled = True
+        self._enabled = True
 
-    @classmethod
-    def disable(cls) -> None:
+    def disable(self) -> None:
         """
         Disable the strategy.
         """
-        cls._enabled = False
+        self._enabled = False
 
-    @classmethod
     @abstractmethod
-    def handle(cls, exception: Exception, func: Callable, args: tuple, **kwargs: dict) -> Tuple[bool, Any]:
+    def handle(self, exception: Exception, func: Callable, args: tuple, **kwargs: dict) -> Tuple[bool, Any]:
         """
         Handle the exception and optionally attempt recovery.
         """
         pass
 
-    @classmethod
     @abstractmethod
-    def can_handle(cls, exception: Exception) -> bool:
+    def can_handle(self, exception: Exception) -> bool:
         """
         Check if the strategy can handle the exception.
         """
         pass
 
-    @classmethod
-    def priority(cls) -> int:
+    def priority(self) -> int:
         """
         Return the priority of the strategy. Lower values are executed
         first.
         """
-        return cls._priority
+        return self._priority
 
-    @classmethod
-    def set_priority(cls, priority: int) -> None:
+    def set_priority(self, priority: int) -> None:
         """
         Set the priority of the strategy. Lower values are executed first. Value must be an integer between 0 and 100
         inclusive.
+
+        For strategies registered with an error handler, use BaseErrorHandler.set_strategy_priority instead: the
+        handler caches dispatch order by priority and a direct set_priority does not invalidate those caches.
         """
         if not isinstance(priority, int):
             raise ValueError("Priority must be an integer.")
 
-        min_priority: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY_MINIMUM", 1))
-        max_priority: int = int(os.getenv("DEFAULT_ERROR_STRATEGY_PRIORITY_MAXIMUM", 100))
-        if priority < min_priority or priority > max_priority:
-            raise ValueError(f"Priority must be between {min_priority} and {max_priority} inclusive.")
+        if priority < _MIN_PRIORITY or priority > _MAX_PRIORITY:
+            raise ValueError(f"Priority must be between {_MIN_PRIORITY} and {_MAX_PRIORITY} inclusive.")
 
-        cls._priority = priority
+        self._priority = priority
 
 
 
@@ -148,5 +164,5 @@ def error_handling_strategy(cls):
         ... class MyStrategy(ErrorHandlingStrategy):
         ...     pass
     """
-    register_strategy(cls.__name__, cls)
+    register_strategy(cls.__name__, cls())
     return cls
\ No newline at end of file
@@ -1,10 +1,21 @@
 from typing import Callable, Any
 
-from typeguard import typechecked
-
+from .._typecheck import typechecked
 from .core import ErrorHandlingStrategy, DEFAULT_ERROR_HANDLING_STRATEGIES
 
 
+def _coerce(value: Any) -> Any:
+    """
+    Return the value as an int when it is a digit-only string; ints pass through untouched and anything else is
+    returned as-is. Avoids the str(value) round-trip for values that are already the target type.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
 @typechecked
 class StringToIntStrategy(ErrorHandlingStrategy):
     """
@@ -33,15 +44,14 @@ class StringToIntStrategy(ErrorHandlingStrategy):
         Raises:
             The original exception if the function still fails.
         """
-        func = kwargs.pop("func")
-        new_args = [int(arg) if str(arg).isnumeric() else arg for arg in args]
-        new_kwargs = {key: int(value) if str(value).isnumeric() else value for key, value in kwargs.items()}
+        func = kwargs.pop("func", None)
+        if func is None:
+            return False, exception
+        new_args = [_coerce(arg) for arg in args]
+        new_kwargs = {key: _coerce(value) for key, value in kwargs.items()}
 
-        print(f"new_args: {new_args}")
-        print(f"new_kwargs: {new_kwargs}")
         try:
             result = func(*new_args, **new_kwargs)
             return True, result
-        except Exception as e:
-            print(e)
+        except Exception:
             return False, exception
@@ -1,8 +1,20 @@
+import atexit
+import functools
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
 
-from src.utilities.logger.formatters import CustomFormatter
-from src.utilities.logger.handlers import ConsoleLogHandler, FileLogHandler
+from src.logger.formatters import CustomFormatter
+from src.logger.handlers import ConsoleLogHandler, FileLogHandler
+
+# Skip the sys._getframe() walk logging performs per record to locate the
+# caller, plus the thread/process introspection — none of our formats use
+# pathname/lineno/module/thread/process fields anymore.
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 
 class CustomLogger(logging.Logger):
@@ -40,30 +52,54 @@ class CustomLogger(logging.Logger):
 logging.setLoggerClass(CustomLogger)
 
 
+# Shared queue and background listener: loggers only enqueue records, while
+# formatting and console/file I/O happen on the listener's dedicated thread.
+_LOG_QUEUE: Optional[queue.SimpleQueue] = None
+_LISTENER: Optional[QueueListener] = None
+
+
+def _ensure_listener() -> queue.SimpleQueue:
+    """
+    Start the shared background log listener on first use and return its queue.
+    """
+    global _LOG_QUEUE, _LISTENER
+    if _LISTENER is None:
+        _LOG_QUEUE = queue.SimpleQueue()
+
+        # Create a custom formatter that includes timestamp, log level,
+        # message, and any extra custom context.
+        console_formatter = CustomFormatter(
+            fmt="%(name)32s | %(levelname)8s | %(message)s %(custom)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        file_formatter = CustomFormatter(
+            fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s %(custom)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+        console_handler = ConsoleLogHandler(level=logging.DEBUG, formatter=console_formatter)
+        file_handler = FileLogHandler(file_path="application.log", level=logging.INFO, formatter=file_formatter)
+
+        _LISTENER = QueueListener(_LOG_QUEUE, console_handler, file_handler, respect_handler_level=True)
+        _LISTENER.start()
+        atexit.register(_LISTENER.stop)
+    return _LOG_QUEUE
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
-    Retrieve a custom logger instance by name.
+    Retrieve a custom logger instance by name. The returned logger only enqueues records; the actual emission runs on
+    the shared background listener thread, so log calls never stall on file I/O.
+
+    Repeated calls with the same name return the same configured logger without re-attaching handlers — previously
+    every module-level get_logger call piled another pair of handlers onto the logger, amplifying each emit.
     """
     logger = logging.getLogger(name)
     logger.propagate = False
     logger.setLevel(logging.DEBUG)
-
-    # Create a custom formatter that includes timestamp, log level, module, function,
-    # line number, message, and any extra custom context.
-    console_formatter = CustomFormatter(
-        fmt="%(name)32s:%(lineno)d | %(levelname)8s | %(message)s %(custom)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_formatter = CustomFormatter(
-        fmt="%(asctime)s | %(levelname)s | %(name)s | %(module)s:%(lineno)3d | %(message)s %(custom)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
-    # Create and register output handlers.
-    console_handler = ConsoleLogHandler(level=logging.DEBUG, formatter=console_formatter)
-    file_handler = FileLogHandler(file_path="application.log", level=logging.INFO, formatter=file_formatter)
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if not logger.handlers:
+        logger.addHandler(QueueHandler(_ensure_listener()))
     return logger
 
 
@@ -75,7 +111,7 @@ if __name__ == "__main__":
     # Create a custom formatter that includes timestamp, log level, module, function,
     # line number, message, and any extra custom context.
     formatter = CustomFormatter(
-        fmt="%(asctime)s | %(levelname)8s | %(name)16s | %(module)s:%(lineno)d | %(message)s %(custom)s",
+        fmt="%(asctime)s | %(levelname)8s | %(name)16s | %(message)s %(custom)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
 
@@ -7,10 +7,28 @@ class CustomFormatter(logging.Formatter):
     It formats extra contextual data (passed via the 'custom' keyword) into a
     human-readable string.
     """
+    def __init__(self, fmt=None, datefmt=None, style='%', validate=True):
+        super().__init__(fmt, datefmt, style, validate)
+        # The fmt string never changes after construction, so whether it uses
+        # %(asctime)s can be decided once instead of per record.
+        self._uses_time = self.usesTime()
+
     def format(self, record: logging.LogRecord) -> str:
         # If extra contextual data is provided, attach it as a formatted string.
-        if hasattr(record, "custom_context") and record.custom_context:
-            record.custom = " ".join(f"{k}={v}" for k, v in record.custom_context.items())
+        # A single getattr replaces the hasattr probe, and the list-comp join
+        # only runs for records that actually carry context.
+        custom_context = getattr(record, "custom_context", None)
+        if custom_context:
+            record.custom = " ".join([f"{k}={v}" for k, v in custom_context.items()])
         else:
             record.custom = ""
-        return super().format(record)
+
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+
+        # Fast path for plain records: apply the precompiled percent-style
+        # directly and skip Formatter.format's exception/stack branches.
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        return self._style.format(record)
@@ -27,6 +27,49 @@ BUILDER_CLASSES = [
     TriggerBuilder
 ]
 
+# Precomputed attribute -> builder class map. The builder set never changes at
+# runtime, so resolution is a single dict lookup instead of a hasattr probe
+# over every builder class per access. Earlier classes win, matching the old
+# first-match scan order.
+_ATTR_MAP = {}
+for _class in reversed(BUILDER_CLASSES):
+    for _name in dir(_class):
+        if not _name.startswith("_"):
+            _ATTR_MAP[_name] = _class
+del _class, _name
+
+
+# Module-level factories: zero-indirection constructor calls for hot callers,
+# skipping the staticmethod descriptor dispatch on the Builder facade.
+def select(*args, **kwargs) -> SelectQueryBuilder:
+    """Create a SELECT query builder."""
+    return SelectQueryBuilder(*args, **kwargs)
+
+
+def insert(*args, **kwargs) -> InsertQueryBuilder:
+    """Create an INSERT query builder."""
+    return InsertQueryBuilder(*args, **kwargs)
+
+
+def update(*args, **kwargs) -> UpdateQueryBuilder:
+    """Create an UPDATE query builder."""
+    return UpdateQueryBuilder(*args, **kwargs)
+
+
+def delete(*args, **kwargs) -> DeleteQueryBuilder:
+    """Create a DELETE query builder."""
+    return DeleteQueryBuilder(*args, **kwargs)
+
+
+def schema() -> SchemaBuilder:
+    """Create a schema builder."""
+    return SchemaBuilder()
+
+
+def trigger() -> TriggerBuilder:
+    """Create a trigger builder."""
+    return TriggerBuilder()
+
 
 class QueryBuilderMeta(type):
     def __getattr__(cls, item):
@@ -42,42 +85,20 @@ class QueryBuilderMeta(type):
         Raises:
             AttributeError: If the attribute is not found in any of the builders.
         """
-        for class_ in BUILDER_CLASSES:
-            if hasattr(class_, item):
-                return getattr(class_, item)
-        raise AttributeError(f"'{cls.__name__}' object has no attribute '{item}'")
+        try:
+            return getattr(_ATTR_MAP[item], item)
+        except KeyError:
+            raise AttributeError(f"'{cls.__name__}' object has no attribute '{item}'") from None
 
 
 class Builder(metaclass=QueryBuilderMeta):
     def __new__(cls, *args, **kwargs):
         raise NotImplementedError("This class is not meant to be instantiated. Use the factory methods instead.")
 
-    @staticmethod
-    def select(*args, **kwargs) -> SelectQueryBuilder:
-        """Factory method for SELECT operations."""
-        return SelectQueryBuilder(*args, **kwargs)
-
-    @staticmethod
-    def insert(*args, **kwargs) -> InsertQueryBuilder:
-        """Factory method for INSERT operations."""
-        return InsertQueryBuilder(*args, **kwargs)
-
-    @staticmethod
-    def update(*args, **kwargs) -> UpdateQueryBuilder:
-        """Factory method for UPDATE operations."""
-        return UpdateQueryBuilder(*args, **kwargs)
-
-    @staticmethod
-    def delete(*args, **kwargs) -> DeleteQueryBuilder:
-        """Factory method for DELETE operations."""
-        return DeleteQueryBuilder(*args, **kwargs)
-
-    @staticmethod
-    def schema() -> SchemaBuilder:
-        """Factory method for schema-related operations."""
-        return SchemaBuilder()
-
-    @staticmethod
-    def trigger() -> TriggerBuilder:
-        """Factory method for trigger operations."""
-        return TriggerBuilder()
+    # Back-compat facade; the module-level factories above are the direct path.
+    select = staticmethod(select)
+    insert = staticmethod(insert)
+    update = staticmethod(update)
+    delete = staticmethod(delete)
+    schema = staticmethod(schema)
+    trigger = staticmethod(trigger)
@@ -1,51 +1,74 @@
-import logging
-from typing import List, Any, Optional, Iterable, Tuple
-
-from src.utilities.logger import get_logger
-from src.utilities.error_handler.decorators import error_handler
-
-logger = get_logger(__name__)
-logger.debug(logging.INFO)
-
-
-class ParameterManager:
-    def __init__(self):
-        self._params: List[Any] = []
-        self._cached_query: Optional[str] = None
-        self._cached_params: Optional[List[Any]] = None
-
-    @property
-    def params(self) -> List[Any]:
-        return self._params
-
-    @error_handler("logging", logger=logger)
-    def add_param(self, value: Any) -> None:
-        self._params.append(value)
-
-    @error_handler("logging", logger=logger)
-    def extend(self, values: Iterable[Any]) -> None:
-        self._params.extend(values)
-
-    @error_handler("logging", logger=logger)
-    def cache(self, query: str) -> None:
-        self._cached_query = query
-        self._cached_params = self._params.copy()
-
-    @error_handler("logging", logger=logger)
-    def get_cached(self) -> Optional[Tuple[str, List[Any]]]:
-        if self._cached_query is not None:
-            return self._cached_query, self._cached_params
-        return None
-
-    @error_handler("logging", logger=logger)
-    def generate_placeholders(self) -> str:
-        return ", ".join("?" for _ in self._params)
-
-    @staticmethod
-    def generate_named_placeholders(column_names: List[str]) -> str:
-        return ", ".join(f":{col}" for col in column_names)
-
-    @error_handler("logging", logger=logger)
-    def reset_cache(self) -> None:
-        self._cached_query = None
-        self._cached_params = None
+import functools
+from typing import List, Any, Optional, Iterable, Tuple
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@functools.lru_cache(maxsize=64)
+def _placeholders(n: int) -> str:
+    """
+    Return a comma-separated run of n '?' placeholders. Most queries reuse a
+    handful of arities, so the string is built once per distinct length.
+    """
+    return "" if n == 0 else "?" + ", ?" * (n - 1)
+
+
+class ParameterManager:
+    # Empty on purpose: ParameterManager is only ever mixed into BuilderBase,
+    # and two bases with non-empty __slots__ would give BuilderBase conflicting
+    # instance layouts. The actual slots live on BuilderBase.
+    __slots__ = ()
+
+    def __init__(self):
+        self._params: List[Any] = []
+        self._version: int = 0
+        self._cached_query: Optional[str] = None
+        self._cached_params: Optional[Tuple[Any, ...]] = None
+        self._cached_version: Optional[int] = None
+
+    @property
+    def params(self) -> List[Any]:
+        return self._params
+
+    def _touch(self) -> None:
+        """
+        Record a state mutation. The cache is valid only while the version it
+        was written under matches the current one, so mutators just bump the
+        counter instead of scattering dirty-flag writes.
+        """
+        self._version += 1
+
+    def add_param(self, value: Any) -> None:
+        self._params.append(value)
+        self._version += 1
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self._params.extend(values)
+        self._version += 1
+
+    def cache(self, query: str) -> None:
+        # Snapshot as a tuple: immutable, shared on every cache hit, and safe
+        # against later mutation of _params (the old list copy was aliased to
+        # callers, so a post-hit add_param could corrupt the cached snapshot).
+        self._cached_query = query
+        self._cached_params = tuple(self._params)
+        self._cached_version = self._version
+
+    def get_cached(self) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        if self._cached_query is not None and self._cached_version == self._version:
+            return self._cached_query, self._cached_params
+        return None
+
+    def generate_placeholders(self) -> str:
+        return _placeholders(len(self._params))
+
+    @staticmethod
+    def generate_named_placeholders(column_names: List[str]) -> str:
+        return ", ".join(f":{col}" for col in column_names)
+
+    def reset_cache(self) -> None:
+        self._cached_query = None
+        self._cached_params = None
+        self._cached_version = None
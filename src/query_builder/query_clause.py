@@ -1,34 +1,48 @@
 import logging
 
-from src.utilities.query_builder.where import Where, WhereGroup
-from src.utilities.logger import get_logger
+from src.query_builder.where import Where, WhereGroup
+from src.logger import get_logger
 
 logger = get_logger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
 class QueryClauseBuilder:
-    def add(self, type_, *args):
-        if isinstance(args[0], (Where, WhereGroup)):
-            if type_ == "where":
-                self.where_conditions.append(args[0])
-            elif type_ == "having":
-                self.having = args[0]
-        elif type_ == "limit":
-            self.limit += args[0]
-        elif type_ == "order_by":
-            self.order_by.append(args)
-        elif type_ == "group_by":
-            self.group_by.extend(args)
-        else:
-            raise ValueError(f"Invalid type: {type_}")
+    __slots__ = ("where_conditions", "order_by", "limit", "offset", "group_by", "having")
+
+    def __init__(self):
+        self.where_conditions = []
+        self.order_by = []
+        self.limit = None
+        self.offset = None
+        self.group_by = []
+        self.having = None
+
+    def add_where(self, condition) -> None:
+        self.where_conditions.append(condition)
+
+    def add_having(self, condition) -> None:
+        self.having = condition
+
+    def add_limit(self, limit: int) -> None:
+        self.limit = limit
+
+    def add_offset(self, offset: int) -> None:
+        self.offset = offset
+
+    def add_order_by(self, *columns) -> None:
+        self.order_by.extend(columns)
+
+    def add_group_by(self, *columns: str) -> None:
+        self.group_by.extend(columns)
 
     def build_query_clauses(self) -> str:
         clauses = []
 
         if self.where_conditions:
-            logger.debug(f"Building where clause with conditions: {self.where_conditions}")
-            where_clause = "WHERE " + " AND ".join(condition.build() for condition in self.where_conditions)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Building where clause with conditions: %s", self.where_conditions)
+            where_clause = "WHERE " + " AND ".join([condition.build() for condition in self.where_conditions])
             clauses.append(where_clause)
         if self.group_by:
             group_clause = "GROUP BY " + ", ".join(self.group_by)
@@ -42,10 +56,15 @@ class QueryClauseBuilder:
         if self.offset is not None:
             clauses.append(f"OFFSET {self.offset}")
 
+        # Most queries carry zero or one clause; skip the join for those.
+        if not clauses:
+            return ""
+        if len(clauses) == 1:
+            return clauses[0]
         return " ".join(clauses)
 
     def reset_query_clause(self):
-        self.where_conditions = None
+        self.where_conditions = []
         self.order_by = []
         self.limit = None
         self.offset = None
@@ -1,7 +1,40 @@
-import re
-from typing import List, Dict, Optional, Set, Any, Union, Iterable, Tuple
+import sys
+from typing import List, Dict, Optional, Any, Union, Iterable, Tuple
 
-from src.utilities.query_builder.base import BuilderBase, DataType, SQLKeywords
+from src.query_builder.base import BuilderBase, DataType, SQLKeywords
+
+
+# Frozen once: membership is a single hash probe instead of rebuilding the
+# keyword iterable per column.
+_SQL_KEYWORDS = frozenset(SQLKeywords.all_keywords())
+
+# Fixed, trusted meta-column definitions; adding them via add_column would
+# re-run identifier/keyword/type validation for the same inputs on every
+# TableCreator construction.
+# Allowed Python types for a column default, flattened so one isinstance call
+# covers each data type. DataType itself stays allowed everywhere because
+# sentinels like DataType.NULL have always been accepted as defaults.
+_DEFAULT_TYPES = {
+    DataType.INTEGER: (int, DataType),
+    DataType.TEXT: (str, DataType),
+    DataType.REAL: (float, DataType),
+    DataType.BLOB: (bytes, str, DataType),
+    DataType.NULL: (type(None), DataType),
+    DataType.TIMESTAMP: (str, DataType),
+}
+
+_PRIMARY_DEF = "id INTEGER NOT NULL"
+_META_COLUMN_DEFS = {
+    "created_at": "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+    "updated_at": "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+    "deleted_at": "deleted_at TIMESTAMP DEFAULT NULL",
+}
+
+
+def _is_sql_ident(s: str) -> bool:
+    # Equivalent to the old [a-zA-Z_][a-zA-Z0-9_]* regex but stays in C string
+    # methods: no SRE dispatch, no Match allocation.
+    return s.isascii() and s.isidentifier()
 
 
 class TableCreator(BuilderBase):
@@ -16,27 +49,28 @@ class TableCreator(BuilderBase):
             **kwargs
     ):
         super().__init__()
-        if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", table_name) is None:
+        if not _is_sql_ident(table_name):
             raise ValueError("Invalid table name.")
 
         self.table_name = table_name
         self.columns: Dict[str, str] = {}
         self.primary_key: Optional[str] = None
-        self.unique_constraints: Set[str] = set()
+        # Insertion-ordered so the emitted SQL is stable across runs; the
+        # values are never used, the dict is just an ordered set.
+        self.unique_constraints: Dict[str, None] = {}
         self.foreign_keys: List[Dict[str, str]] = []  # [{'column': str, 'ref_table': str, 'ref_column': str}]
 
         # Add default columns
-        if primary and meta_columns:
-            self.add_primary_column()
-
-        if created_at and meta_columns:
-            self.add_column("created_at", DataType.TIMESTAMP, allow_nulls=True, default="CURRENT_TIMESTAMP")
-
-        if updated_at and meta_columns:
-            self.add_column("updated_at", DataType.TIMESTAMP, allow_nulls=True, default="CURRENT_TIMESTAMP")
-
-        if deleted_at and meta_columns:
-            self.add_column("deleted_at", DataType.TIMESTAMP, default="NULL")
+        if meta_columns:
+            if primary:
+                self.columns["id"] = _PRIMARY_DEF
+                self.primary_key = "id"
+            if created_at:
+                self.columns["created_at"] = _META_COLUMN_DEFS["created_at"]
+            if updated_at:
+                self.columns["updated_at"] = _META_COLUMN_DEFS["updated_at"]
+            if deleted_at:
+                self.columns["deleted_at"] = _META_COLUMN_DEFS["deleted_at"]
 
         self._metadata = {
             "temporary": False,
@@ -67,38 +101,25 @@ class TableCreator(BuilderBase):
         if name in self.columns and not override:
             raise ValueError(f"Column '{name}' already exists in the table. Use 'override=True' to replace it.")
 
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", name):
+        if not _is_sql_ident(name):
             raise ValueError(f"Invalid column name '{name}'.")
 
-        if name.upper() in SQLKeywords.all_keywords():
+        if name.upper() in _SQL_KEYWORDS:
             raise ValueError(f"Column name '{name}' is a reserved keyword.")
 
         if not isinstance(data_type, DataType):
             raise ValueError(f"Invalid data type '{data_type}'.")
 
-        default_data_types = {
-            DataType.INTEGER: int,
-            DataType.TEXT: str,
-            DataType.REAL: float,
-            DataType.BLOB: (bytes, str),
-            DataType.NULL: type(None),
-            DataType.TIMESTAMP: str
-        }
-
-        if default is not None:
-            types = default_data_types[data_type]
-            if not isinstance(default, (types, type(DataType.NULL))):
-                raise ValueError(f"Default value '{default}' does not match data type '{data_type}'.")
-
-        column_definition = f"{name} {data_type}"
-
-        if not allow_nulls:
-            column_definition += " NOT NULL"
-
-        if default is not None:
-            column_definition += f" DEFAULT {default}"
+        if default is not None and not isinstance(default, _DEFAULT_TYPES[data_type]):
+            raise ValueError(f"Default value '{default}' does not match data type '{data_type}'.")
 
-        self.columns[name] = column_definition
+        # Column names repeat heavily across tables (id, user_id, ...);
+        # interning dedupes the storage and makes later dict lookups hit the
+        # identity fast path.
+        name = sys.intern(name)
+        null_part = "" if allow_nulls else " NOT NULL"
+        default_part = f" DEFAULT {default}" if default is not None else ""
+        self.columns[name] = f"{name} {data_type}{null_part}{default_part}"
         return self
 
     def add_primary_column(self, name: str = "id", data_type: DataType = DataType.INTEGER) -> "TableCreator":
@@ -111,12 +132,12 @@ class TableCreator(BuilderBase):
         """Sets a column as the primary key."""
         if column not in self.columns:
             raise ValueError(f"Primary key column '{column}' not found in table columns.")
-        self.primary_key = column
+        self.primary_key = sys.intern(column)
         return self
 
     def add_unique_constraint(self, column: str) -> "TableCreator":
         """Adds a unique constraint to a column."""
-        self.unique_constraints.add(column)
+        self.unique_constraints[sys.intern(column)] = None
         return self
 
     def add_foreign_key(self, column: str, ref_table: str, ref_column: str = "id") -> "TableCreator":
@@ -125,40 +146,39 @@ class TableCreator(BuilderBase):
             raise ValueError(f"Foreign key column '{column}' not found in table columns.")
 
         self.foreign_keys.append({
-            "column": column,
-            "ref_table": ref_table,
-            "ref_column": ref_column
+            "column": sys.intern(column),
+            "ref_table": sys.intern(ref_table),
+            "ref_column": sys.intern(ref_column)
         })
         return self
 
     def build_query_clauses(self) -> Tuple[str, Iterable]:
         """Generates the SQL query for table creation."""
-        if not self.columns or len(self.columns) == 0:
+        if not self.columns:
             raise ValueError("No columns defined for the table.")
 
-        # Column definitions
-        column_definitions = ", ".join(self.columns.values())
+        # Accumulate every definition and constraint, then join once.
+        defs: List[str] = list(self.columns.values())
 
-        # Primary key
         if self.primary_key:
-            column_definitions += f", PRIMARY KEY ({self.primary_key})"
-
-        # Unique constraints
-        for unique in self.unique_constraints:
-            column_definitions += f", UNIQUE ({unique})"
-
-        # Foreign keys
-        for fk in self.foreign_keys:
-            column_definitions += (
-                f", FOREIGN KEY ({fk['column']}) REFERENCES {fk['ref_table']} ({fk['ref_column']})"
-            )
-
-        parts = [
-            "CREATE",
-            "TEMPORARY" if self._metadata.get("temporary", False) else "",
-            "TABLE",
-            "IF NOT EXISTS" if self._metadata.get("if_not_exists", False) else "",
-            self.table_name,
-            f"({column_definitions})"
-        ]
-        return " ".join([p for p in parts if len(p) > 0]) + ";",
+            defs.append(f"PRIMARY KEY ({self.primary_key})")
+
+        defs.extend(f"UNIQUE ({unique})" for unique in self.unique_constraints)
+        defs.extend(
+            f"FOREIGN KEY ({fk['column']}) REFERENCES {fk['ref_table']} ({fk['ref_column']})"
+            for fk in self.foreign_keys
+        )
+
+        column_definitions = ", ".join(defs)
+
+        parts = ["CREATE"]
+        if self._metadata.get("temporary", False):
+            parts.append("TEMPORARY")
+        parts.append("TABLE")
+        if self._metadata.get("if_not_exists", False):
+            parts.append("IF NOT EXISTS")
+        parts.extend((self.table_name, f"({column_definitions})"))
+        # CREATE TABLE carries no bound parameters; the empty list keeps the
+        # (query, params) contract shared with the other builders. A stray
+        # trailing comma used to turn the return into a 1-tuple of the SQL.
+        return " ".join(parts) + ";", []
@@ -1,6 +1,12 @@
-from src.utilities.query_builder.base import BuilderBase
-
-
-class TriggerBuilder(BuilderBase):
-    def create_trigger(self, name: str, event: str, table: str, action: str) -> str:
-        return f"CREATE TRIGGER {name} {event} ON {table} FOR EACH ROW {action}"
+from src.query_builder.base import BuilderBase
+
+# Shared template: one method call per trigger instead of re-running the
+# f-string's per-substitution bytecode.
+_TRIGGER_TMPL = "CREATE TRIGGER {name} {event} ON {table} FOR EACH ROW {action}"
+
+
+class TriggerBuilder(BuilderBase):
+    def create_trigger(self, name: str, event: str, table: str, action: str) -> str:
+        self._validate_table_name(name)
+        self._validate_table_name(table)
+        return _TRIGGER_TMPL.format(name=name, event=event, table=table, action=action)
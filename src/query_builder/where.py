@@ -1,7 +1,37 @@
-from typing import List, Any, overload, Union
+import re
+from typing import List, Any, Optional, Tuple, overload, Union
+
+# Tokenizer for raw "column operator value" expressions; compiled once so
+# add_raw never touches re's pattern cache. Covers the same operator set as
+# _OPERATORS below, with the longer alternatives first so "<=" is not matched
+# as "<" and "IS NOT" / "NOT IN" are not cut short at "IS" / "IN".
+_COND_RE = re.compile(
+    r"^(\w+)\s+"
+    r"(IS\s+NOT|NOT\s+BETWEEN|NOT\s+IN|NOT\s+LIKE|<>|<=|>=|!=|=|<|>|BETWEEN|LIKE|IN|IS)"
+    r"\s+(.+)$",
+    re.I,
+)
+
+# Operators accepted by WhereGroup.add; mirrors SQLKeywords.OPERATORS, which
+# cannot be imported here without a base -> query_clause -> where cycle.
+_OPERATORS = frozenset((
+    "=", "!=", "<>", ">", "<", ">=", "<=", "IS", "IS NOT", "LIKE", "IN",
+    "BETWEEN", "NOT IN", "NOT LIKE", "NOT BETWEEN",
+))
+
+# Output templates keyed on (operator is not None, param is None); a single
+# dict probe replaces the two-branch chain in Where.build.
+_BUILD_FMT = {
+    (True, False): "{lo} {col} {op} ?",
+    (True, True): "{lo} {col} {op} ?",
+    (False, False): "{lo} {col} = ?",
+    (False, True): "{lo} {col} IS NULL",
+}
 
 
 class Where:
+    __slots__ = ("column", "operator", "param", "logical_operator", "_built")
+
     def __init__(
             self,
             column: str,
@@ -13,16 +43,34 @@ class Where:
         self.operator: str = operator
         self.param: Union[int, float, str] = param
         self.logical_operator: str = logical_operator
+        self._built: Optional[str] = None
 
-    def build(self) -> str:
+    def build(self, include_logical: bool = True) -> str:
         """Return the WHERE condition as a string."""
+        # The fields are never mutated after construction, so the prefixed
+        # form is rendered once; the bare form is a cheap slice off it.
+        built = self._built
+        if built is None:
+            fmt = _BUILD_FMT[(self.operator is not None, self.param is None)]
+            built = fmt.format(lo=self.logical_operator, col=self.column, op=self.operator)
+            self._built = built
+
+        if include_logical:
+            return built
+        return built[len(self.logical_operator) + 1:]
+
+    def write(self, out: List[str], is_first: bool = False) -> None:
+        """Append this condition's raw tokens to a shared buffer."""
+        if not is_first:
+            out.append(self.logical_operator)
+        out.append(self.column)
         if self.operator:
-            return f"{self.logical_operator} {self.column} {self.operator} ?"
-
-        if self.param is None:
-            return f"{self.logical_operator} {self.column} IS NULL"
-
-        return f"{self.logical_operator} {self.column} = ?"
+            out.append(self.operator)
+            out.append("?")
+        elif self.param is None:
+            out.append("IS NULL")
+        else:
+            out.append("= ?")
 
     def as_dict(self) -> dict:
         """Return the WHERE condition as a dictionary."""
@@ -41,81 +89,97 @@ class WhereGroup:
         self.conditions: List[Where] = []
         self.params: List[Any] = []
         self.logical_operator: str = logical_operator
+        self._params_tuple: Optional[Tuple[Any, ...]] = None
 
     @overload
     def add(self, column: str) -> "WhereGroup":
         ...
 
-    @overload
-    def add(self, column: str, logical_operator: str) -> "WhereGroup":
-        ...
-
-    @overload
-    def add(self, column: str, param: Union[int, float, str]) -> "WhereGroup":
-        ...
-
-    @overload
-    def add(self, column: str, param: Union[int, float, str], logical_operator: str) -> "WhereGroup":
-        ...
-
-    @overload
-    def add(self, column: str, operator: str, param: Union[int, float, str]) -> "WhereGroup":
-        ...
-
     @overload
     def add(self, column: str, operator: str, param: Union[int, float, str], logical_operator: str) -> "WhereGroup":
         ...
 
-    def add(self, *args, **kwargs) -> "WhereGroup":
-        """Add a condition to the group."""
-        logical_operator = kwargs.get("logical_operator", "AND")
+    def add(self, column, operator=None, param=None, *, logical_operator="AND") -> "WhereGroup":
+        """
+        Add a condition from discrete parts. Use add_raw for the string
+        convenience form ("age > 30").
+        """
         if logical_operator not in ("AND", "OR"):
             raise ValueError("Logical operator must be 'AND' or 'OR'.")
 
-        if "?" in args[0] and len(args) == 1 and "param" not in kwargs:
-            raise ValueError("Parameter value missing for the condition.")
+        # Back-compat: route whole-expression strings to the parsing path.
+        if operator is None and param is None and " " in column:
+            return self.add_raw(column, logical_operator=logical_operator)
 
-        if " " in args[0] and "param" in kwargs:
-            column, operator, q = args[0].split(" ", 2)
-            param = kwargs["param"]
+        # Fail fast on old-style add(column, param) calls, which would
+        # otherwise store the value as the operator and emit malformed SQL.
+        if operator is not None and (
+                not isinstance(operator, str) or operator.upper() not in _OPERATORS
+        ):
+            raise ValueError(
+                f"Invalid operator: {operator!r}. Pass discrete arguments as "
+                f"add(column, operator, param) or a value as add(column, param=value)."
+            )
 
-        elif len(args) == 1 and " " in args[0]:
-            column, operator, param = args[0].split(" ", 2)
-            param = param.strip("'").strip('"')
-
-        elif len(args) == 1:
-            column = args[0]
-            operator = None
-            param = None
-
-        elif len(args) == 2:
-            column, param = args
-            if " " in column:
-                column, operator, q = column.split(" ")
-            operator = kwargs.get("operator", None)
+        self.conditions.append(Where(column, operator, param, logical_operator))
+        if param is not None:
+            self.params.append(param)
+            self._params_tuple = None
+        return self
 
-        elif len(args) == 3:
-            column, operator, param = args
+    def add_raw(self, expr: str, param=None, logical_operator: str = "AND") -> "WhereGroup":
+        """Add a condition from a raw "column operator value" expression."""
+        if logical_operator not in ("AND", "OR"):
+            raise ValueError("Logical operator must be 'AND' or 'OR'.")
 
-        else:
-            raise ValueError("Invalid number of arguments.")
+        if "?" in expr and param is None:
+            raise ValueError("Parameter value missing for the condition.")
 
-        if str(param).isnumeric():
-            param = int(param)
+        if " " not in expr:
+            return self.add(expr, logical_operator=logical_operator)
+
+        m = _COND_RE.match(expr)
+        if m is None:
+            raise ValueError(f"Cannot parse condition: {expr!r}")
+
+        column = m.group(1)
+        # Normalize case and collapse any run of whitespace inside the
+        # multi-word operators.
+        operator = " ".join(m.group(2).upper().split())
+        if param is None:
+            # Only values parsed out of the expression are coerced; an
+            # explicitly passed param keeps its type (floats, bools, ...).
+            param = m.group(3).strip("'").strip('"')
+            try:
+                param = int(param)
+            except ValueError:
+                pass
 
         self.conditions.append(Where(column, operator, param, logical_operator))
         if param is not None:
             self.params.append(param)
+            self._params_tuple = None
         return self
 
-    def get_params(self) -> List[Any]:
-        """Retrieve the parameters."""
-        return self.params
+    def get_params(self) -> Tuple[Any, ...]:
+        """
+        Retrieve the parameters as an immutable snapshot. The tuple is built
+        once per add() cycle, so repeat renders share one object and callers
+        cannot mutate the group's internal list.
+        """
+        params = self._params_tuple
+        if params is None:
+            params = self._params_tuple = tuple(self.params)
+        return params
 
     def build(self) -> str:
         """Return the complete WHERE condition as a string."""
         if not self.conditions:
             return ""
 
-        where_clause = f" ".join([condition.build() for condition in self.conditions])
-        return f"({where_clause.strip().split(' ', 1)[1]})"
+        # One shared token buffer and a single join; no per-condition
+        # intermediate strings.
+        out: List[str] = []
+        for i, condition in enumerate(self.conditions):
+            condition.write(out, is_first=i == 0)
+        return f"({' '.join(out)})"
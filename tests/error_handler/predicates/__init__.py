@@ -1,9 +1,7 @@
 import unittest
 from unittest.mock import Mock
 
-from typeguard import TypeCheckError
-
-from src.error_handler.exceptions import PredicateNameError
+from src.error_handler.exceptions import PredicateFunctionException, PredicateNameError
 from src.error_handler.predicates.core import PredicateFactory, BasePredicate, Predicate
 from src.error_handler.strategies.core import ErrorHandlingStrategy
 
@@ -21,11 +19,11 @@ class TestPredicateFactory(unittest.TestCase):
         self.assertFalse(predicate(mock_strategy))
 
     def test_raises_error_with_invalid_name(self):
-        with self.assertRaises(TypeCheckError):
+        with self.assertRaises(PredicateNameError):
             PredicateFactory.create_predicate(None, lambda x: True)
 
     def test_raises_error_with_invalid_function(self):
-        with self.assertRaises(TypeCheckError):
+        with self.assertRaises(PredicateFunctionException):
             PredicateFactory.create_predicate("test_predicate", None)
 
 